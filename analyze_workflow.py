@@ -12,6 +12,7 @@ Kullanım:
 import sys
 import argparse
 from pathlib import Path
+from io import StringIO
 from workflow_analyzer_module import analyze_workflow
 
 
@@ -77,27 +78,28 @@ def main():
 
 def _generate_markdown_report(analysis) -> str:
     """Markdown rapor oluştur"""
-    report = []
-    report.append("# 📋 UiPath Workflow Analiz Raporu\n")
-    report.append(f"**Workflow**: {analysis.workflow_name}\n")
-    report.append(f"**Sağlık Skoru**: {analysis.overall_health_score:.1f}/100\n\n")
+    buf = StringIO()
+    w = buf.write
+    w("# 📋 UiPath Workflow Analiz Raporu\n\n")
+    w(f"**Workflow**: {analysis.workflow_name}\n\n")
+    w(f"**Sağlık Skoru**: {analysis.overall_health_score:.1f}/100\n\n")
     
-    report.append("## 📊 Özet\n")
-    report.append(f"- Aktivite: {len(analysis.activities)}\n")
-    report.append(f"- Değişken: {len(analysis.variables)}\n")
-    report.append(f"- Sorun: {len(analysis.issues)}\n")
-    report.append(f"- Öneri: {len(analysis.recommendations)}\n\n")
+    w("## 📊 Özet\n\n")
+    w(f"- Aktivite: {len(analysis.activities)}\n")
+    w(f"- Değişken: {len(analysis.variables)}\n")
+    w(f"- Sorun: {len(analysis.issues)}\n")
+    w(f"- Öneri: {len(analysis.recommendations)}\n\n")
     
     if analysis.issues:
-        report.append("## ⚠️ Sorunlar\n\n")
+        w("## ⚠️ Sorunlar\n\n")
         for issue in analysis.issues:
-            report.append(f"### {issue.title}\n")
-            report.append(f"- **Severity**: {issue.severity}\n")
-            report.append(f"- **Category**: {issue.category}\n")
-            report.append(f"- **Problem**: {issue.description}\n")
-            report.append(f"- **Solution**: {issue.solution}\n\n")
+            w(f"### {issue.title}\n\n")
+            w(f"- **Severity**: {issue.severity}\n")
+            w(f"- **Category**: {issue.category}\n")
+            w(f"- **Problem**: {issue.description}\n")
+            w(f"- **Solution**: {issue.solution}\n\n")
     
-    return '\n'.join(report)
+    return buf.getvalue()
 
 
 if __name__ == '__main__':
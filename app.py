@@ -7,12 +7,12 @@ real-time analysis, and PDF export capabilities.
 
 import streamlit as st
 import pandas as pd
-from pathlib import Path
-import tempfile
 import os
 from datetime import datetime
-from io import BytesIO
+from io import BytesIO, StringIO
 import json
+import hashlib
+from dataclasses import asdict
 
 # Import analyzer modules
 from workflow_analyzer_module import (
@@ -22,6 +22,13 @@ from workflow_analyzer_module import (
     WorkflowAnalyzer
 )
 
+# Try to import orjson for faster JSON export
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Try to import reportlab for PDF generation
 try:
     from reportlab.lib.pagesizes import letter, A4
@@ -34,16 +41,8 @@ except ImportError:
     HAS_REPORTLAB = False
 
 
-# Configure Streamlit page
-st.set_page_config(
-    page_title="UiPath Workflow Analyzer",
-    page_icon="🤖",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS
-st.markdown("""
+# Custom CSS, built once and re-sent unchanged on every rerun
+_CSS = """
     <style>
     .main {
         padding-top: 2rem;
@@ -87,7 +86,41 @@ st.markdown("""
         border-radius: 0.25rem;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+# Issue card CSS classes and icons by severity
+_SEVERITY_CLASSES = {
+    "Critical": "issue-critical",
+    "High": "issue-high",
+    "Medium": "issue-medium",
+    "Low": "issue-low"
+}
+
+_SEVERITY_EMOJIS = {
+    "Critical": "🔴",
+    "High": "🟠",
+    "Medium": "🟡",
+    "Low": "🟢"
+}
+
+# Characters of the markdown report rendered before "Show full report" is ticked
+_MARKDOWN_PREVIEW_CHARS = 4096
+
+# st.cache_data is shared by all sessions; bound it so uploads cannot grow memory without limit
+_CACHE_MAX_ENTRIES = 32
+_CACHE_TTL_SECONDS = 3600
+
+
+# Configure Streamlit page
+st.set_page_config(
+    page_title="UiPath Workflow Analyzer",
+    page_icon="🤖",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Inject custom CSS
+st.markdown(_CSS, unsafe_allow_html=True)
 
 
 def get_health_color(score: float) -> str:
@@ -100,18 +133,42 @@ def get_health_color(score: float) -> str:
         return "🔴"
 
 
-def generate_pdf_report(analysis) -> BytesIO:
-    """Generate PDF report using ReportLab"""
-    if not HAS_REPORTLAB:
-        return None
-    
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
-    
-    # Container for PDF elements
-    elements = []
-    
-    # Styles
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+def _cached_analyze(xaml_bytes: bytes):
+    """Analyze uploaded XAML bytes; reruns with the same upload reuse the result"""
+    return analyze_workflow(BytesIO(xaml_bytes))
+
+
+# Report caches are keyed by upload only, so the "Generated" stamp in a report is the
+# time of its first render and is reused until the entry is evicted or expires
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+def _cached_pdf_report(workflow_key: str, _analysis) -> bytes:
+    """Render the PDF report at most once per uploaded workflow"""
+    return generate_pdf_report(_analysis).getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+def _cached_markdown_report(workflow_key: str, _analysis) -> str:
+    """Render the markdown report at most once per uploaded workflow"""
+    return generate_markdown_report(_analysis)
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+def _cached_json_report(workflow_key: str, _analysis) -> str:
+    """Render the JSON report at most once per uploaded workflow"""
+    return generate_json_report(_analysis)
+
+
+def _group_activities(analysis) -> list:
+    """Group activities by type in a single pass, most frequent type first"""
+    buckets = {}
+    for act in analysis.activities:
+        buckets.setdefault(act.type, []).append(act)
+    return sorted(buckets.items(), key=lambda kv: -len(kv[1]))
+
+
+def _pdf_flowables(analysis):
+    """Yield the PDF report flowables in document order"""
     styles = getSampleStyleSheet()
     title_style = ParagraphStyle(
         'CustomTitle',
@@ -132,12 +189,12 @@ def generate_pdf_report(analysis) -> BytesIO:
     )
     
     # Title
-    elements.append(Paragraph("📋 UiPath Workflow Analysis Report", title_style))
-    elements.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
-    elements.append(Spacer(1, 0.3*inch))
+    yield Paragraph("📋 UiPath Workflow Analysis Report", title_style)
+    yield Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal'])
+    yield Spacer(1, 0.3*inch)
     
     # Summary Section
-    elements.append(Paragraph("Summary", heading_style))
+    yield Paragraph("Summary", heading_style)
     summary_data = [
         ['Metric', 'Value'],
         ['Workflow Name', analysis.workflow_name],
@@ -159,12 +216,12 @@ def generate_pdf_report(analysis) -> BytesIO:
         ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
         ('GRID', (0, 0), (-1, -1), 1, colors.black)
     ]))
-    elements.append(summary_table)
-    elements.append(Spacer(1, 0.3*inch))
+    yield summary_table
+    yield Spacer(1, 0.3*inch)
     
     # Issues Section
     if analysis.issues:
-        elements.append(Paragraph("Issues Found", heading_style))
+        yield Paragraph("Issues Found", heading_style)
         
         for issue in analysis.issues:
             issue_text = f"""
@@ -174,19 +231,35 @@ def generate_pdf_report(analysis) -> BytesIO:
             <b>Description:</b> {issue.description}<br/>
             <b>Solution:</b> {issue.solution}
             """
-            elements.append(Paragraph(issue_text, styles['Normal']))
-            elements.append(Spacer(1, 0.2*inch))
+            yield Paragraph(issue_text, styles['Normal'])
+            yield Spacer(1, 0.2*inch)
     
     # Recommendations Section
     if analysis.recommendations:
-        elements.append(Paragraph("Recommendations", heading_style))
+        yield Paragraph("Recommendations", heading_style)
         
         for i, rec in enumerate(analysis.recommendations, 1):
-            elements.append(Paragraph(f"{i}. {rec}", styles['Normal']))
-            elements.append(Spacer(1, 0.1*inch))
+            yield Paragraph(f"{i}. {rec}", styles['Normal'])
+            yield Spacer(1, 0.1*inch)
+
+
+def generate_pdf_report(analysis) -> BytesIO:
+    """Generate PDF report using ReportLab"""
+    if not HAS_REPORTLAB:
+        return None
+    
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        topMargin=0.5*inch,
+        bottomMargin=0.5*inch,
+        pageCompression=1,  # Deflate page streams
+        invariant=1  # Same input produces byte-identical output
+    )
     
     # Build PDF
-    doc.build(elements)
+    doc.build(list(_pdf_flowables(analysis)))
     buffer.seek(0)
     return buffer
 
@@ -227,267 +300,263 @@ def main():
     
     # Main content
     if xaml_file:
-        # Save uploaded file to temp directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            xaml_path = Path(temp_dir) / xaml_file.name
-            
-            # Write uploaded file
-            xaml_path.write_bytes(xaml_file.getbuffer())
-            
-            # Run analysis
-            with st.spinner("🔍 Analyzing workflow..."):
-                try:
-                    analysis = analyze_workflow(str(xaml_path))
+        # Run analysis
+        with st.spinner("🔍 Analyzing workflow..."):
+            try:
+                xaml_bytes = xaml_file.getvalue()
+                workflow_key = hashlib.sha1(xaml_bytes).hexdigest()
+                analysis = _cached_analyze(xaml_bytes)
+                
+                # Display tabs
+                tab1, tab2, tab3, tab4, tab5 = st.tabs([
+                    "📊 Overview",
+                    "🔧 Activities",
+                    "⚠️ Issues",
+                    "💡 Recommendations",
+                    "📥 Export"
+                ])
+                
+                # Tab 1: Overview
+                with tab1:
+                    col1, col2, col3 = st.columns(3)
                     
-                    # Display tabs
-                    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-                        "📊 Overview",
-                        "🔧 Activities",
-                        "⚠️ Issues",
-                        "💡 Recommendations",
-                        "📥 Export"
-                    ])
+                    with col1:
+                        st.metric(
+                            "Health Score",
+                            f"{analysis.overall_health_score:.1f}/100",
+                            delta=f"{get_health_color(analysis.overall_health_score)}",
+                            delta_color="off"
+                        )
                     
-                    # Tab 1: Overview
-                    with tab1:
-                        col1, col2, col3 = st.columns(3)
-                        
+                    with col2:
+                        st.metric("Total Activities", len(analysis.activities))
+                    
+                    with col3:
+                        st.metric("Issues Found", len(analysis.issues))
+                    
+                    st.markdown("---")
+                    
+                    # Workflow Purpose
+                    st.subheader("🎯 Workflow Purpose")
+                    st.info(analysis.workflow_purpose)
+                    
+                    st.markdown("---")
+
+                    st.subheader("🤖 İş Akışı Özeti")
+                    st.write(analysis.prose_summary)
+                    
+                    st.markdown("---")
+                    
+                    # Variables Summary
+                    st.subheader("🔤 Variables")
+                    if analysis.variables:
+                        col1, col2 = st.columns(2)
                         with col1:
-                            st.metric(
-                                "Health Score",
-                                f"{analysis.overall_health_score:.1f}/100",
-                                delta=f"{get_health_color(analysis.overall_health_score)}",
-                                delta_color="off"
-                            )
-                        
+                            st.write(f"**Total Variables**: {len(analysis.variables)}")
                         with col2:
-                            st.metric("Total Activities", len(analysis.activities))
+                            with st.expander("View All Variables"):
+                                st.dataframe(
+                                    pd.DataFrame({"Variable": analysis.variables}),
+                                    use_container_width=True,
+                                    hide_index=True
+                                )
+                    else:
+                        st.warning("No variables found")
+
+                    st.markdown("---")
+
+                    # Components section
+                    st.subheader("🧩 Components Used")
+                    if analysis.components:
+                        st.write(f"**Total Unique Components**: {len(analysis.components)}")
+                        with st.expander("View All Components"):
+                            st.code("\n".join(analysis.components), language="text")
+                    else:
+                        st.warning("No components (activity types) found.")
+
+                    st.markdown("---")
+
+                    # URLs section
+                    st.subheader("🔗 URLs Found")
+                    if analysis.urls:
+                        st.write(f"**Total URLs Found**: {len(analysis.urls)}")
+                        with st.expander("View All URLs"):
+                            st.markdown("\n".join(f"- [{url}]({url})" for url in analysis.urls))
+                    else:
+                        st.warning("No URLs found in the workflow.")
+                    
+                    st.markdown("---")
+                    
+                    # Dependencies
+                    if analysis.dependencies:
+                        st.subheader("📦 Dependencies")
+                        dep_df = pd.DataFrame({
+                            "Package": list(analysis.dependencies.keys()),
+                            "Version": list(analysis.dependencies.values())
+                        })
+                        st.dataframe(dep_df, use_container_width=True, hide_index=True)
+                
+                # Tab 2: Activities
+                with tab2:
+                    st.subheader("📌 Workflow Activities")
+                    
+                    if analysis.activities:
+                        # Group by type
+                        activity_groups = _group_activities(analysis)
                         
-                        with col3:
-                            st.metric("Issues Found", len(analysis.issues))
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            st.metric("Total Activities", len(analysis.activities))
+                        with col2:
+                            st.metric("Activity Types", len(activity_groups))
                         
                         st.markdown("---")
                         
-                        # Workflow Purpose
-                        st.subheader("🎯 Workflow Purpose")
-                        st.info(analysis.workflow_purpose)
+                        # Activity breakdown
+                        for act_type, activities_of_type in activity_groups:
+                            with st.expander(f"**{act_type}** ({len(activities_of_type)})"):
+                                for act in activities_of_type:
+                                    st.write(f"**{act.name}**")
+                                    st.caption(act.purpose)
+                    else:
+                        st.warning("No activities found")
+                
+                # Tab 3: Issues
+                with tab3:
+                    st.subheader("⚠️ Issues & Problems")
+                    
+                    if analysis.issues:
+                        # Summary by severity
+                        severity_counts = analysis.issue_index.counts
                         
-                        st.markdown("---")
-
-                        st.subheader("🤖 İş Akışı Özeti")
-                        st.write(analysis.prose_summary)
+                        col1, col2, col3, col4 = st.columns(4)
                         
-                        st.markdown("---")
+                        with col1:
+                            st.metric("🔴 Critical", severity_counts.get("Critical", 0))
+                        with col2:
+                            st.metric("🟠 High", severity_counts.get("High", 0))
+                        with col3:
+                            st.metric("🟡 Medium", severity_counts.get("Medium", 0))
+                        with col4:
+                            st.metric("🟢 Low", severity_counts.get("Low", 0))
                         
-                        # Variables Summary
-                        st.subheader("🔤 Variables")
-                        if analysis.variables:
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.write(f"**Total Variables**: {len(analysis.variables)}")
-                            with col2:
-                                with st.expander("View All Variables"):
-                                    for var in analysis.variables:
-                                        st.code(var)
-                        else:
-                            st.warning("No variables found")
-
-                        st.markdown("---")
-
-                        # Components section
-                        st.subheader("🧩 Components Used")
-                        if analysis.components:
-                            st.write(f"**Total Unique Components**: {len(analysis.components)}")
-                            with st.expander("View All Components"):
-                                for comp in analysis.components:
-                                    st.code(comp)
-                        else:
-                            st.warning("No components (activity types) found.")
-
                         st.markdown("---")
-
-                        # URLs section
-                        st.subheader("🔗 URLs Found")
-                        if analysis.urls:
-                            st.write(f"**Total URLs Found**: {len(analysis.urls)}")
-                            with st.expander("View All URLs"):
-                                for url in analysis.urls:
-                                    st.info(f"[{url}]({url})")
-                        else:
-                            st.warning("No URLs found in the workflow.")
                         
-                        st.markdown("---")
+                        # Filter by severity
+                        severity_filter = st.selectbox(
+                            "Filter by Severity",
+                            ["All", "Critical", "High", "Medium", "Low"]
+                        )
                         
-                        # Dependencies
-                        if analysis.dependencies:
-                            st.subheader("📦 Dependencies")
-                            dep_data = {
-                                "Package": list(analysis.dependencies.keys()),
-                                "Version": list(analysis.dependencies.values())
-                            }
-                            st.table(dep_data)
-                    
-                    # Tab 2: Activities
-                    with tab2:
-                        st.subheader("📌 Workflow Activities")
+                        st.markdown("---")
                         
-                        if analysis.activities:
-                            # Group by type
-                            from collections import Counter
-                            activity_types = Counter(act.type for act in analysis.activities)
-                            
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.metric("Total Activities", len(analysis.activities))
-                            with col2:
-                                st.metric("Activity Types", len(activity_types))
-                            
-                            st.markdown("---")
-                            
-                            # Activity breakdown
-                            for act_type, count in activity_types.most_common():
-                                with st.expander(f"**{act_type}** ({count})"):
-                                    activities_of_type = [a for a in analysis.activities if a.type == act_type]
-                                    for act in activities_of_type:
-                                        st.write(f"**{act.name}**")
-                                        st.caption(act.purpose)
+                        # Display issues
+                        if severity_filter == "All":
+                            filtered_issues = analysis.issues
                         else:
-                            st.warning("No activities found")
-                    
-                    # Tab 3: Issues
-                    with tab3:
-                        st.subheader("⚠️ Issues & Problems")
+                            filtered_issues = analysis.issue_index.by_severity.get(severity_filter, [])
                         
-                        if analysis.issues:
-                            # Summary by severity
-                            from collections import Counter
-                            severity_counts = Counter(issue.severity for issue in analysis.issues)
-                            
-                            col1, col2, col3, col4 = st.columns(4)
-                            
-                            with col1:
-                                st.metric("🔴 Critical", severity_counts.get("Critical", 0))
-                            with col2:
-                                st.metric("🟠 High", severity_counts.get("High", 0))
-                            with col3:
-                                st.metric("🟡 Medium", severity_counts.get("Medium", 0))
-                            with col4:
-                                st.metric("🟢 Low", severity_counts.get("Low", 0))
-                            
-                            st.markdown("---")
-                            
-                            # Filter by severity
-                            severity_filter = st.selectbox(
-                                "Filter by Severity",
-                                ["All", "Critical", "High", "Medium", "Low"]
+                        # Render all issue cards in a single markdown element
+                        html_parts = []
+                        for issue in filtered_issues:
+                            html_parts.append(
+                                f'<div class="{_SEVERITY_CLASSES[issue.severity]}">'
+                                f'<h4>{_SEVERITY_EMOJIS[issue.severity]} {issue.title}</h4>'
+                                f'<p><b>Category:</b> {issue.category}</p>'
+                                f'<p><b>Location:</b> {issue.location}</p>'
+                                f'<p><b>Problem:</b> {issue.description}</p>'
+                                f'<p><b>Solution:</b> {issue.solution}</p>'
+                                f'</div>'
                             )
-                            
-                            st.markdown("---")
-                            
-                            # Display issues
-                            filtered_issues = analysis.issues
-                            if severity_filter != "All":
-                                filtered_issues = [i for i in analysis.issues if i.severity == severity_filter]
-                            
-                            for issue in filtered_issues:
-                                severity_colors = {
-                                    "Critical": "issue-critical",
-                                    "High": "issue-high",
-                                    "Medium": "issue-medium",
-                                    "Low": "issue-low"
-                                }
-                                
-                                severity_emojis = {
-                                    "Critical": "🔴",
-                                    "High": "🟠",
-                                    "Medium": "🟡",
-                                    "Low": "🟢"
-                                }
-                                
-                                st.markdown(f"""
-                                <div class="{severity_colors[issue.severity]}">
-                                    <h4>{severity_emojis[issue.severity]} {issue.title}</h4>
-                                    <p><b>Category:</b> {issue.category}</p>
-                                    <p><b>Location:</b> {issue.location}</p>
-                                    <p><b>Problem:</b> {issue.description}</p>
-                                    <p><b>Solution:</b> {issue.solution}</p>
-                                </div>
-                                """, unsafe_allow_html=True)
-                        else:
-                            st.success("✅ No issues found! Your workflow looks good!")
+                        st.markdown("\n".join(html_parts), unsafe_allow_html=True)
+                    else:
+                        st.success("✅ No issues found! Your workflow looks good!")
+                
+                # Tab 4: Recommendations
+                with tab4:
+                    st.subheader("💡 Improvement Recommendations")
                     
-                    # Tab 4: Recommendations
-                    with tab4:
-                        st.subheader("💡 Improvement Recommendations")
-                        
-                        if analysis.recommendations:
-                            for i, rec in enumerate(analysis.recommendations, 1):
-                                st.info(f"**{i}. {rec}**")
-                        else:
-                            st.success("✅ No recommendations at this time!")
+                    if analysis.recommendations:
+                        for i, rec in enumerate(analysis.recommendations, 1):
+                            st.info(f"**{i}. {rec}**")
+                    else:
+                        st.success("✅ No recommendations at this time!")
+                
+                # Tab 5: Export
+                with tab5:
+                    st.subheader("📥 Export Analysis Results")
                     
-                    # Tab 5: Export
-                    with tab5:
-                        st.subheader("📥 Export Analysis Results")
+                    # Markdown Export
+                    if "Markdown" in export_format:
+                        st.markdown("#### 📄 Markdown Report")
                         
-                        # Markdown Export
-                        if "Markdown" in export_format:
-                            st.markdown("#### 📄 Markdown Report")
-                            
-                            markdown_report = generate_markdown_report(analysis)
-                            
-                            st.download_button(
-                                label="⬇️ Download Markdown Report",
-                                data=markdown_report,
-                                file_name=f"workflow_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                                mime="text/markdown",
-                                use_container_width=True
-                            )
-                            
-                            with st.expander("Preview Markdown"):
-                                st.markdown(markdown_report)
+                        markdown_report = _cached_markdown_report(workflow_key, analysis)
                         
-                        st.markdown("---")
+                        st.download_button(
+                            label="⬇️ Download Markdown Report",
+                            data=markdown_report,
+                            file_name=f"workflow_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+                            mime="text/markdown",
+                            use_container_width=True
+                        )
                         
-                        # PDF Export
-                        if "PDF" in export_format:
-                            st.markdown("#### 📕 PDF Report")
+                        # Expander content is sent even when collapsed; keep the default payload small
+                        with st.expander("Preview Markdown"):
+                            if len(markdown_report) <= _MARKDOWN_PREVIEW_CHARS or st.checkbox(
+                                "Show full report", key="md_preview_full"
+                            ):
+                                st.markdown(markdown_report)
+                            else:
+                                cut = markdown_report.rfind("\n", 0, _MARKDOWN_PREVIEW_CHARS)
+                                if cut <= 0:
+                                    cut = _MARKDOWN_PREVIEW_CHARS
+                                st.markdown(markdown_report[:cut] + "\n\n...")
+                    
+                    st.markdown("---")
+                    
+                    # PDF Export
+                    if "PDF" in export_format:
+                        st.markdown("#### 📕 PDF Report")
+                        
+                        if HAS_REPORTLAB:
+                            # PDF layout is the most expensive export; build it only on request
+                            if st.button("🛠️ Prepare PDF Report", use_container_width=True):
+                                st.session_state["pdf_ready_for"] = workflow_key
                             
-                            if HAS_REPORTLAB:
-                                pdf_buffer = generate_pdf_report(analysis)
-                                
+                            if st.session_state.get("pdf_ready_for") == workflow_key:
                                 st.download_button(
                                     label="⬇️ Download PDF Report",
-                                    data=pdf_buffer,
+                                    data=_cached_pdf_report(workflow_key, analysis),
                                     file_name=f"workflow_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
                                     mime="application/pdf",
                                     use_container_width=True
                                 )
-                            else:
-                                st.warning("⚠️ PDF export requires reportlab. Install with: `pip install reportlab`")
+                        else:
+                            st.warning("⚠️ PDF export requires reportlab. Install with: `pip install reportlab`")
+                    
+                    st.markdown("---")
+                    
+                    # JSON Export
+                    if "JSON" in export_format:
+                        st.markdown("#### 📋 JSON Export")
                         
-                        st.markdown("---")
+                        json_report = _cached_json_report(workflow_key, analysis)
                         
-                        # JSON Export
-                        if "JSON" in export_format:
-                            st.markdown("#### 📋 JSON Export")
-                            
-                            json_report = generate_json_report(analysis)
-                            
-                            st.download_button(
-                                label="⬇️ Download JSON Report",
-                                data=json_report,
-                                file_name=f"workflow_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                                mime="application/json",
-                                use_container_width=True
-                            )
-                            
-                            with st.expander("Preview JSON"):
-                                st.json(json.loads(json_report))
-                
-                except Exception as e:
-                    st.error(f"❌ Error during analysis: {str(e)}")
-                    st.exception(e)
+                        st.download_button(
+                            label="⬇️ Download JSON Report",
+                            data=json_report,
+                            file_name=f"workflow_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                            mime="application/json",
+                            use_container_width=True
+                        )
+                        
+                        with st.expander("Preview JSON"):
+                            # st.json passes a JSON string through as-is, so no decode is needed
+                            st.json(json_report)
+            
+            except Exception as e:
+                st.error(f"❌ Error during analysis: {str(e)}")
+                st.exception(e)
     
     else:
         # Welcome message
@@ -518,85 +587,83 @@ def main():
 
 def generate_markdown_report(analysis) -> str:
     """Generate markdown report"""
-    report = []
+    buf = StringIO()
+    w = buf.write
     
-    report.append("# 📋 UiPath Workflow Analysis Report\n")
-    report.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    report.append("---\n\n")
+    w("# 📋 UiPath Workflow Analysis Report\n\n")
+    w(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    w("---\n\n")
     
     # Summary
-    report.append("## 📊 Summary\n\n")
-    report.append(f"| Metric | Value |\n")
-    report.append(f"|--------|-------|\n")
-    report.append(f"| **Workflow Name** | {analysis.workflow_name} |\n")
-    report.append(f"| **Health Score** | {analysis.overall_health_score:.1f}/100 |\n")
-    report.append(f"| **Total Activities** | {len(analysis.activities)} |\n")
-    report.append(f"| **Total Variables** | {len(analysis.variables)} |\n")
-    report.append(f"| **Issues Found** | {len(analysis.issues)} |\n")
-    report.append(f"| **Recommendations** | {len(analysis.recommendations)} |\n\n")
+    w("## 📊 Summary\n\n")
+    rows = (
+        ("Metric", "Value"),
+        ("--------", "-------"),
+        ("**Workflow Name**", analysis.workflow_name),
+        ("**Health Score**", f"{analysis.overall_health_score:.1f}/100"),
+        ("**Total Activities**", len(analysis.activities)),
+        ("**Total Variables**", len(analysis.variables)),
+        ("**Issues Found**", len(analysis.issues)),
+        ("**Recommendations**", len(analysis.recommendations)),
+    )
+    w("\n".join(f"| {k} | {v} |" for k, v in rows))
+    w("\n\n")
     
     # Purpose
-    report.append("## 🎯 Workflow Purpose\n\n")
-    report.append(f"{analysis.workflow_purpose}\n\n")
+    w("## 🎯 Workflow Purpose\n\n")
+    w(f"{analysis.workflow_purpose}\n\n")
     
     # Activities
-    report.append("## 📌 Activities\n\n")
+    w("## 📌 Activities\n\n")
     if analysis.activities:
-        from collections import Counter
-        activity_types = Counter(act.type for act in analysis.activities)
-        for act_type, count in activity_types.most_common():
-            report.append(f"### {act_type} ({count})\n")
-            activities_of_type = [a for a in analysis.activities if a.type == act_type]
+        for act_type, activities_of_type in _group_activities(analysis):
+            w(f"### {act_type} ({len(activities_of_type)})\n\n")
             for act in activities_of_type:
-                report.append(f"- **{act.name}**: {act.purpose}\n")
-            report.append("\n")
+                w(f"- **{act.name}**: {act.purpose}\n")
+            w("\n")
     
     # Variables
-    report.append("## 🔤 Variables\n\n")
+    w("## 🔤 Variables\n\n")
     if analysis.variables:
         for var in analysis.variables:
-            report.append(f"- `{var}`\n")
-    report.append("\n")
+            w(f"- `{var}`\n")
+    w("\n")
     
     # Issues
-    report.append("## ⚠️ Issues\n\n")
+    w("## ⚠️ Issues\n\n")
     if analysis.issues:
-        from collections import defaultdict
-        by_severity = defaultdict(list)
-        for issue in analysis.issues:
-            by_severity[issue.severity].append(issue)
-        
+        by_severity = analysis.issue_index.by_severity
         for severity in ["Critical", "High", "Medium", "Low"]:
             if severity in by_severity:
-                report.append(f"### {severity}\n\n")
+                w(f"### {severity}\n\n")
                 for issue in by_severity[severity]:
-                    report.append(f"**{issue.title}**\n")
-                    report.append(f"- **Category**: {issue.category}\n")
-                    report.append(f"- **Location**: {issue.location}\n")
-                    report.append(f"- **Problem**: {issue.description}\n")
-                    report.append(f"- **Solution**: {issue.solution}\n\n")
+                    w(f"**{issue.title}**\n\n")
+                    w(f"- **Category**: {issue.category}\n")
+                    w(f"- **Location**: {issue.location}\n")
+                    w(f"- **Problem**: {issue.description}\n")
+                    w(f"- **Solution**: {issue.solution}\n\n")
     else:
-        report.append("✅ No issues found!\n\n")
+        w("✅ No issues found!\n\n")
     
     # Recommendations
-    report.append("## 💡 Recommendations\n\n")
+    w("## 💡 Recommendations\n\n")
     if analysis.recommendations:
         for i, rec in enumerate(analysis.recommendations, 1):
-            report.append(f"{i}. {rec}\n")
-    report.append("\n")
+            w(f"{i}. {rec}\n")
+    w("\n")
     
     # Dependencies
     if analysis.dependencies:
-        report.append("## 📦 Dependencies\n\n")
+        w("## 📦 Dependencies\n\n")
         for dep, version in analysis.dependencies.items():
-            report.append(f"- `{dep}`: {version}\n")
+            w(f"- `{dep}`: {version}\n")
     
-    return "\n".join(report)
+    return buf.getvalue()
 
 
-def generate_json_report(analysis) -> str:
-    """Generate JSON report"""
-    report_dict = {
+def _build_report_dict(analysis) -> dict:
+    """Build the JSON report structure; activities and issues stay dataclasses"""
+    return {
         "metadata": {
             "generated": datetime.now().isoformat(),
             "tool": "UiPath Workflow Analyzer",
@@ -611,31 +678,25 @@ def generate_json_report(analysis) -> str:
             "recommendations_count": len(analysis.recommendations)
         },
         "workflow_purpose": analysis.workflow_purpose,
-        "activities": [
-            {
-                "name": act.name,
-                "type": act.type,
-                "purpose": act.purpose
-            }
-            for act in analysis.activities
-        ],
+        "activities": analysis.activities,
         "variables": analysis.variables,
-        "issues": [
-            {
-                "title": issue.title,
-                "severity": issue.severity,
-                "category": issue.category,
-                "description": issue.description,
-                "location": issue.location,
-                "solution": issue.solution
-            }
-            for issue in analysis.issues
-        ],
+        "issues": analysis.issues,
         "recommendations": analysis.recommendations,
         "dependencies": analysis.dependencies
     }
+
+
+def generate_json_report(analysis) -> str:
+    """Generate JSON report"""
+    report_dict = _build_report_dict(analysis)
     
-    return json.dumps(report_dict, ensure_ascii=False, indent=2)
+    # Activity/Issue dataclasses are serialized directly, without an intermediate dict
+    if HAS_ORJSON:
+        return orjson.dumps(
+            report_dict,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(report_dict, ensure_ascii=False, indent=2, default=asdict)
 
 
 if __name__ == "__main__":
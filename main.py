@@ -1,10 +1,135 @@
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Optional, Union
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from html import escape
+from io import StringIO
+from string import Template
 import re
-
-@dataclass
+import sys
+
+# Modül yüklenirken bir kez derlenen düzenli ifadeler
+_DRIVE_PATH_RE = re.compile(r"[a-zA-Z]:\\")
+_NAME_CONV_RE = re.compile(r"^[a-z]+([A-Z][a-z0-9]+)*$|^[A-Z][a-z0-9]+([A-Z][a-z0-9]+)*$")
+_URL_RE = re.compile(r'https?://[^\s"\'\]]+')
+
+# Önceden genişletilmiş namespace'li isimler
+_ACTIVITIES_NS = "http://schemas.microsoft.com/netfx/2009/xaml/activities"
+_XAML_NS = "http://schemas.microsoft.com/winfx/2006/xaml"
+_X_TYPE_ARGUMENTS = f"{{{_XAML_NS}}}TypeArguments"
+
+# check_* metodlarının okuduğu öznitelikler (tag -> öznitelik adları);
+# yükleme geçişinde yalnızca bunlar kopyalanır
+_ATTR_WHITELIST = {
+    "WriteCellX": ("AutoIncrementRow",),
+    "NTypeInto": ("ClickBeforeMode", "EmptyFieldMode"),
+    "NClick": ("DisplayName",),
+    "TargetAnchorable": ("BrowserURL", "FullSelectorArgument", "FuzzySelectorArgument"),
+    "Variable": ("Name", _X_TYPE_ARGUMENTS),
+}
+_NO_ATTRS: Dict[str, str] = {}
+
+# Bu boyutun üzerindeki dosyalar akış (streaming) modunda işlenir
+_STREAMING_THRESHOLD = 50 * 1024 * 1024
+
+# İçinde iç içe aktivite sayımı yapılan kapsayıcılar -> sayılan aktiviteler
+_NESTED_WATCH = {
+    "ForEachRow": frozenset({"ExcelProcessScopeX", "ExcelApplicationCard", "TryCatch", "LogMessage"}),
+    "NApplicationCard": frozenset({"NApplicationCard"}),
+}
+
+# Tam tag -> localname önbelleği; aynı tag'ler tekrar bölünmez
+_LOCALNAME_CACHE: Dict[str, str] = {}
+
+
+def _localname(tag: str, _cache: Dict[str, str] = _LOCALNAME_CACHE) -> str:
+    """'{namespace}Tag' biçimindeki tag'in localname'ini (interned) döndür"""
+    local = _cache.get(tag)
+    if local is None:
+        local = _cache[tag] = sys.intern(tag.rpartition('}')[2])
+    return local
+
+
+# HTML rapor şablonları (modül yüklenirken bir kez hazırlanır)
+_HTML_HEADER = Template("""\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>UiPath XAML Analiz Raporu</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        h1 { color: #333; border-bottom: 3px solid #007acc; padding-bottom: 10px; }
+        h2 { color: #333; border-bottom: 2px solid #ccc; padding-bottom: 5px; margin-top: 40px;}
+        .summary { display: flex; gap: 20px; margin: 20px 0; }
+        .summary-box { flex: 1; padding: 20px; border-radius: 8px; text-align: center; color: white;}
+        .critical { background: #d9534f; }
+        .warning { background: #f0ad4e; }
+        .info { background: #5bc0de; }
+        .issue { margin: 20px 0; padding: 20px; border-left: 4px solid; border-radius: 5px; background: #f9f9f9;}
+        .issue.critical-border { border-left-color: #d9534f; }
+        .issue.warning-border { border-left-color: #f0ad4e; }
+        .issue.info-border { border-left-color: #5bc0de; }
+        .issue h3 { margin-top: 0; }
+        .issue-category { display: inline-block; padding: 5px 10px; color: white; border-radius: 3px; font-size: 12px; }
+        .category-critical { background: #d9534f; }
+        .category-warning { background: #f0ad4e; }
+        .category-info { background: #5bc0de; }
+        .issue-location { color: #666; font-style: italic; }
+        .suggestion { background: #e8f4f8; padding: 15px; border-radius: 5px; margin-top: 10px; }
+        .resource-list { list-style-type: none; padding-left: 0; }
+        .resource-list li { background: #eee; padding: 8px 12px; margin-bottom: 5px; border-radius: 3px; font-family: monospace; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>📊 UiPath XAML Analiz Raporu</h1>
+        <p><strong>Dosya:</strong> $file_name</p>
+
+        <div class="summary">
+            <div class="summary-box critical">
+                <h2>$n_critical</h2>
+                <p>Kritik Sorun</p>
+            </div>
+            <div class="summary-box warning">
+                <h2>$n_warning</h2>
+                <p>Uyarı</p>
+            </div>
+            <div class="summary-box info">
+                <h2>$n_info</h2>
+                <p>Bilgilendirme</p>
+            </div>
+        </div>
+""")
+
+_HTML_ISSUE = Template("""
+<div class="issue $severity-border">
+    <span class="issue-category category-$severity">$category</span>
+    <h3>$description</h3>
+    <p class="issue-location">📍 $location</p>
+    <div class="suggestion">
+        <strong>💡 Öneri:</strong> $suggestion
+    </div>
+</div>
+""")
+
+_HTML_FOOTER = """
+    </div>
+</body>
+</html>
+"""
+
+_HTML_SECTIONS = (
+    ("CRITICAL", "🔴 Kritik Sorunlar"),
+    ("WARNING", "⚠️ Uyarılar"),
+    ("INFO", "ℹ️ Bilgilendirmeler"),
+)
+
+@dataclass(slots=True, frozen=True)
 class Issue:
     """Tespit edilen sorun"""
     severity: str  # CRITICAL, WARNING, INFO
@@ -22,20 +147,58 @@ class UiPathXAMLAnalyzer:
         self.root = None
         self.namespaces = {}
         self.issues: List[Issue] = []
+        self._seen: Set[Issue] = set()
         self.urls: Set[str] = set()
         self.db_connections: Set[str] = set()
         self.used_activities: Set[str] = set()
 
+        # Yükleme geçişinde toplanan ve check_* metodlarının kullandığı durum
+        # Akış modunda kovalar canlı element yerine öznitelik sözlüklerini tutar
+        self._by_tag: Dict[str, List[Union[ET.Element, Dict[str, str]]]] = defaultdict(list)
+        self._attrs: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+        self._nested_counts: Dict[str, List[Dict[str, int]]] = defaultdict(list)
+        self._click_next_tags: List[Optional[str]] = []
+        self._workbook_paths: List[str] = []
+        self._open_watchers: List[tuple] = []
+        self._frames: List[list] = []
+        self._max_depth = 0
+        self._streaming = False
+        self._delay_tag = ""
+        self._n_seq = 0
+        self._n_flow = 0
+        self._by_sev: Dict[str, List[Issue]] = {"CRITICAL": [], "WARNING": [], "INFO": []}
+
     def load_xaml(self):
-        """XAML dosyasını yükle"""
+        """XAML dosyasını tek geçişte yükle; namespace'leri ve analiz durumunu topla"""
         try:
-            self.tree = ET.parse(self.xaml_path)
-            self.root = self.tree.getroot()
-
-            # Namespace'leri otomatik tespit et
-            for event, elem in ET.iterparse(str(self.xaml_path), events=['start-ns']):
-                prefix, uri = event
-                self.namespaces[prefix if prefix else 'default'] = uri
+            # Büyük dosyalarda işlenen dallar bellekten atılır; kontroller
+            # element yerine öznitelik kopyaları üzerinde çalışır
+            self._streaming = self.xaml_path.stat().st_size > _STREAMING_THRESHOLD
+            open_elems = []
+
+            # Ağaç, namespace'ler ve tüm kontrollerin ihtiyaç duyduğu durum
+            # aynı iterparse geçişinde elde edilir
+            for event, elem in ET.iterparse(str(self.xaml_path), events=('start', 'end', 'start-ns')):
+                if event == 'start':
+                    if self.root is None:
+                        self.root = elem
+                    self._on_start(elem)
+                    open_elems.append(elem)
+                elif event == 'end':
+                    self._on_end(elem)
+                    open_elems.pop()
+                    if self._streaming:
+                        elem.clear()
+                        if open_elems:
+                            # Kapanan element ve önceki kardeşleri parent'tan ayrılır
+                            del open_elems[-1][:]
+                else:
+                    prefix, uri = elem
+                    self.namespaces[prefix if prefix else 'default'] = uri
+            self.tree = ET.ElementTree(self.root)
+
+            # Click sonrası karşılaştırılan Delay tag'i dosya başına bir kez kurulur
+            self._delay_tag = f"{{{self.namespaces.get('s', _ACTIVITIES_NS)}}}Delay"
 
             return True
         except Exception as e:
@@ -49,6 +212,10 @@ class UiPathXAMLAnalyzer:
 
         print("🔍 UiPath XAML Analizi Başlıyor...\n")
 
+        # Birden fazla kontrolün kullandığı sayılar bir kez alınır
+        self._n_seq = len(self._by_tag.get("Sequence", []))
+        self._n_flow = len(self._by_tag.get("Flowchart", []))
+
         # Analizleri çalıştır
         self.check_error_handling()
         self.check_excel_operations()
@@ -60,221 +227,270 @@ class UiPathXAMLAnalyzer:
         self.check_file_paths()
         self.check_variables()
         self.check_performance()
-        self.extract_resources()
+
+        # Sorunlar rapor ve HTML için bir kez severity bazında gruplanır
+        for issue in self.issues:
+            self._by_sev[issue.severity].append(issue)
 
         # Sonuçları göster
         self.print_report()
 
-    def extract_resources(self):
-        """URL, DB ve Aktiviteler gibi kaynakları çıkar"""
-        self.extract_urls()
-        self.extract_database_connections()
-        self.extract_activities()
+    def _on_start(self, elem: ET.Element):
+        """Element açılışı: tag kovası, iç içe sayaçlar, click komşuluğu ve kaynaklar"""
+        tag = elem.tag
+        local = _localname(tag)
+        attrib = elem.attrib
+
+        # Kontrollerin okuduğu öznitelikler tag bazlı düz tabloya kopyalanır
+        attrs = _NO_ATTRS
+        wanted = _ATTR_WHITELIST.get(local)
+        if wanted is not None:
+            attrs = {key: attrib[key] for key in wanted if key in attrib}
+            self._attrs[local].append(attrs)
+        self._by_tag[local].append(attrs if self._streaming else elem)
+        if '}' in tag:
+            self.used_activities.add(local)
+
+        # Açık ForEachRow/NApplicationCard kapsayıcılarının sayaçlarını güncelle
+        for watched, counts in self._open_watchers:
+            if local in watched:
+                counts[local] = counts.get(local, 0) + 1
+
+        # Önceki kardeş bir NClick ise, ondan hemen sonra gelen tag budur
+        if self._frames:
+            parent_frame = self._frames[-1]
+            if parent_frame[1] is not None:
+                self._click_next_tags[parent_frame[1]] = tag
+                parent_frame[1] = None
+
+        click_index = None
+        if local == "NClick":
+            click_index = len(self._click_next_tags)
+            self._click_next_tags.append(None)
+
+        watched = _NESTED_WATCH.get(local)
+        if watched is not None:
+            counts = {}
+            self._nested_counts[local].append(counts)
+            self._open_watchers.append((watched, counts))
+
+        # Açık çerçeve sayısı elementin derinliğidir (kök = 0)
+        depth = len(self._frames)
+        if depth > self._max_depth:
+            self._max_depth = depth
+
+        # Çerçeve: [bu element NClick ise indeksi, sonrakini bekleyen NClick çocuğu, kapsayıcı mı]
+        self._frames.append([click_index, None, watched is not None])
+
+        if "WorkbookPath" in attrib:
+            self._workbook_paths.append(attrib["WorkbookPath"])
+        if local == "DatabaseConnect":
+            conn_string = attrib.get("ConnectionString")
+            if conn_string:
+                self.db_connections.add(conn_string)
 
-    def find_all_elements(self, tag: str) -> List[ET.Element]:
-        """Tüm elementleri bul (namespace aware)"""
-        results = []
-        for ns_prefix, ns_uri in self.namespaces.items():
-            results.extend(self.root.findall(f".//{{{ns_uri}}}{tag}"))
-        return results
+        # Özniteliği olmayan elementler (çoğunlukla property elementleri)
+        # URL taramasını tamamen atlar; değerler her zaman str'dir
+        if attrib:
+            for key, value in attrib.items():
+                if "Url" in key or "Uri" in key:
+                    if value:
+                        self.urls.add(value.strip())
+                # Bazen URL'ler genel stringlerde olabilir; regex yalnızca
+                # '://' içeren değerlerde çalıştırılır
+                if '://' in value:
+                    self.urls.update(_URL_RE.findall(value))
+
+    def _on_end(self, elem: ET.Element):
+        """Element kapanışı: çerçeveyi kapat, NClick ise sonraki kardeşi beklet"""
+        click_index, _, is_watcher = self._frames.pop()
+        if is_watcher:
+            self._open_watchers.pop()
+        if click_index is not None and self._frames:
+            self._frames[-1][1] = click_index
+
+    def _emit(self, **fields):
+        """Sorunu ekle; aynı alanlara sahip bir sorun zaten varsa tekrar ekleme"""
+        issue = Issue(**fields)
+        if issue in self._seen:
+            return
+        self._seen.add(issue)
+        self.issues.append(issue)
 
     def check_error_handling(self):
         """Try-Catch kontrolü"""
-        try_catch_elements = self.find_all_elements("TryCatch")
-        total_activities = len(self.find_all_elements("Sequence"))
-        total_activities += len(self.find_all_elements("Flowchart"))
+        n_try_catch = len(self._by_tag.get("TryCatch", []))
+        total_activities = self._n_seq + self._n_flow
 
-        if len(try_catch_elements) == 0:
-            self.issues.append(Issue(
+        if n_try_catch == 0:
+            self._emit(
                 severity="CRITICAL",
                 category="Error Handling",
                 description="Hiçbir Try-Catch bloğu bulunamadı",
                 location="Tüm workflow",
                 suggestion="Ana iş akışına ve kritik işlemlere Try-Catch ekleyin. "
                           "Özellikle Excel, Browser ve Loop işlemlerini koruyun."
-            ))
-        elif len(try_catch_elements) < total_activities / 2:
-            self.issues.append(Issue(
+            )
+        elif n_try_catch < total_activities / 2:
+            self._emit(
                 severity="WARNING",
                 category="Error Handling",
-                description=f"Yetersiz hata yönetimi: {len(try_catch_elements)} Try-Catch, "
+                description=f"Yetersiz hata yönetimi: {n_try_catch} Try-Catch, "
                           f"{total_activities} aktivite için",
                 location="Çeşitli lokasyonlar",
                 suggestion="Kritik işlemlere daha fazla hata yönetimi ekleyin"
-            ))
+            )
 
     def check_excel_operations(self):
         """Excel işlemlerini kontrol et"""
-        excel_scopes = self.find_all_elements("ExcelProcessScopeX")
-        excel_app_cards = self.find_all_elements("ExcelApplicationCard")
-        for_each_rows = self.find_all_elements("ForEachRow")
-        write_cells = self.find_all_elements("WriteCellX")
+        write_cells = self._attrs.get("WriteCellX", [])
 
         # Excel scope döngü içinde mi?
-        for loop in for_each_rows:
-            # Döngü içindeki tüm çocuk elementleri kontrol et
-            nested_excel = self._find_nested_elements(loop, ["ExcelProcessScopeX", "ExcelApplicationCard"])
-            if nested_excel:
-                self.issues.append(Issue(
+        for counts in self._nested_counts.get("ForEachRow", []):
+            # Döngü içindeki Excel kapsamları yükleme geçişinde sayıldı
+            if counts.get("ExcelProcessScopeX") or counts.get("ExcelApplicationCard"):
+                self._emit(
                     severity="CRITICAL",
                     category="Performance",
                     description="Excel Process Scope/Application Card döngü içinde bulundu",
                     location="ForEachRow içinde",
                     suggestion="Excel dosyasını döngü DIŞINDA açın, sadece Write işlemini döngü içinde yapın. "
                               "Bu 10-100x performans artışı sağlar."
-                ))
+                )
 
         # Write Cell işlemleri
         if len(write_cells) > 0:
             for write_cell in write_cells:
                 auto_increment = write_cell.get("AutoIncrementRow", "False")
                 if auto_increment == "True":
-                    self.issues.append(Issue(
+                    self._emit(
                         severity="WARNING",
                         category="Excel Operations",
                         description="AutoIncrementRow kullanılıyor",
                         location="WriteCellX aktivitesi",
                         suggestion="AutoIncrement yerine satır indeksi ile çalışmayı düşünün. "
                                   "Daha kontrollü ve tahmin edilebilir."
-                    ))
+                    )
 
     def check_browser_operations(self):
         """Browser işlemlerini kontrol et"""
-        browser_scopes = self.find_all_elements("NApplicationCard")
-
         # İç içe browser scope kontrolü
-        for scope in browser_scopes:
-            nested_scopes = self._find_nested_elements(scope, ["NApplicationCard"])
-            if nested_scopes:
-                self.issues.append(Issue(
+        for counts in self._nested_counts.get("NApplicationCard", []):
+            if counts.get("NApplicationCard"):
+                self._emit(
                     severity="WARNING",
                     category="Browser Operations",
                     description="İç içe Browser Scope bulundu",
                     location="NApplicationCard içinde NApplicationCard",
                     suggestion="İç içe browser scope'ları kaldırın. Tek bir scope yeterlidir."
-                ))
+                )
 
         # Type Into işlemleri
-        type_intos = self.find_all_elements("NTypeInto")
+        type_intos = self._attrs.get("NTypeInto", [])
         for type_into in type_intos:
             click_before = type_into.get("ClickBeforeMode")
             empty_field = type_into.get("EmptyFieldMode")
 
             if empty_field != "SingleLine":
-                self.issues.append(Issue(
+                self._emit(
                     severity="INFO",
                     category="Browser Operations",
                     description="Type Into EmptyFieldMode önerisi",
                     location="NTypeInto aktivitesi",
                     suggestion="EmptyFieldMode='SingleLine' kullanarak alanı önce temizleyin"
-                ))
+                )
 
         # Click işlemlerinden sonra delay kontrolü
-        clicks = self.find_all_elements("NClick")
-        delay_tag = f"{{{self.namespaces.get('s', 'http://schemas.microsoft.com/netfx/2009/xaml/activities')}}}Delay"
-        for i, click in enumerate(clicks):
+        clicks = self._attrs.get("NClick", [])
+        delay_tag = self._delay_tag
+        for click, next_tag in zip(clicks, self._click_next_tags):
             display_name = click.get("DisplayName", "")
             if "calculate" in display_name.lower() or "submit" in display_name.lower():
-                # Sonraki elementi kontrol et
-                parent = self._find_parent(self.root, click)
-                if parent is not None:
-                    children = list(parent)
-                    click_index = children.index(click)
-                    if click_index < len(children) - 1:
-                        next_elem = children[click_index + 1]
-                        if next_elem.tag != delay_tag:
-                            self.issues.append(Issue(
-                                severity="WARNING",
-                                category="Browser Operations",
-                                description=f"'{display_name}' sonrası bekleme yok",
-                                location="NClick aktivitesi",
-                                suggestion="Calculate/Submit butonundan sonra 2-3 saniye Delay ekleyin. "
-                                          "Sayfa yanıt süresi için gerekli."
-                            ))
+                # Sonraki kardeş element (yükleme geçişinde kaydedildi)
+                if next_tag is not None and next_tag != delay_tag:
+                    self._emit(
+                        severity="WARNING",
+                        category="Browser Operations",
+                        description=f"'{display_name}' sonrası bekleme yok",
+                        location="NClick aktivitesi",
+                        suggestion="Calculate/Submit butonundan sonra 2-3 saniye Delay ekleyin. "
+                                  "Sayfa yanıt süresi için gerekli."
+                    )
 
     def check_loops(self):
         """Döngü yapılarını kontrol et"""
-        for_each_rows = self.find_all_elements("ForEachRow")
-
-        for loop in for_each_rows:
+        for counts in self._nested_counts.get("ForEachRow", []):
             # Döngü içinde Try-Catch var mı?
-            try_catches = self._find_nested_elements(loop, ["TryCatch"])
-            if not try_catches:
-                self.issues.append(Issue(
+            if not counts.get("TryCatch"):
+                self._emit(
                     severity="CRITICAL",
                     category="Error Handling",
                     description="ForEachRow döngüsü içinde Try-Catch yok",
                     location="ForEachRow aktivitesi",
                     suggestion="Döngü içinde her iterasyonu Try-Catch ile koruyun. "
                               "Bir satırda hata olsa bile diğer satırlar işlensin."
-                ))
+                )
 
             # Döngü içinde Log Message var mı?
-            log_messages = self._find_nested_elements(loop, ["LogMessage"])
-            if len(log_messages) < 2:
-                self.issues.append(Issue(
+            if counts.get("LogMessage", 0) < 2:
+                self._emit(
                     severity="WARNING",
                     category="Logging",
                     description="ForEachRow döngüsünde yetersiz logging",
                     location="ForEachRow aktivitesi",
                     suggestion="Her iterasyonun başında ve sonunda log mesajı ekleyin. "
                               "Hata ayıklama için kritik."
-                ))
+                )
 
     def check_selectors(self):
         """Selector güvenilirliğini kontrol et"""
-        all_targets = self.find_all_elements("TargetAnchorable")
+        all_targets = self._attrs.get("TargetAnchorable", [])
 
         for target in all_targets:
             browser_url = target.get("BrowserURL", "")
 
             # URL'de parametreler var mı?
             if "?" in browser_url and len(browser_url.split("?")[1]) > 50:
-                self.issues.append(Issue(
+                self._emit(
                     severity="WARNING",
                     category="Selectors",
                     description="Selector'da uzun parametreli URL kullanılıyor",
                     location="TargetAnchorable",
                     suggestion="Dinamik parametreler içeren URL'ler selector'ları kırabilir. "
                               "Sadece base URL kullanın veya wildcard kullanın."
-                ))
+                )
 
             # Selector güvenilirliği
             full_selector = target.get("FullSelectorArgument", "")
             fuzzy_selector = target.get("FuzzySelectorArgument", "")
 
             if not fuzzy_selector and full_selector:
-                self.issues.append(Issue(
+                self._emit(
                     severity="INFO",
                     category="Selectors",
                     description="Sadece Full Selector kullanılıyor, Fuzzy yok",
                     location="TargetAnchorable",
                     suggestion="Fuzzy Selector ekleyerek selector güvenilirliğini artırın"
-                ))
+                )
 
     def check_delays(self):
         """Delay/Wait aktivitelerini kontrol et"""
-        delays = self.find_all_elements("Delay")
-
-        if len(delays) == 0:
-            self.issues.append(Issue(
+        if not self._by_tag.get("Delay"):
+            self._emit(
                 severity="WARNING",
                 category="Timing",
                 description="Hiç Delay aktivitesi bulunamadı",
                 location="Tüm workflow",
                 suggestion="Web işlemleri için uygun yerlere Delay ekleyin. "
                           "Özellikle form submit ve sayfa yükleme sonrasında."
-            ))
+            )
 
     def check_logging(self):
         """Log mesajlarını kontrol et"""
-        log_messages = self.find_all_elements("LogMessage")
+        n_log_messages = len(self._by_tag.get("LogMessage", []))
 
-        total_activities = len(self.find_all_elements("Sequence"))
-        total_activities += len(self.find_all_elements("Flowchart"))
-
-        if len(log_messages) == 0:
-            self.issues.append(Issue(
+        if n_log_messages == 0:
+            self._emit(
                 severity="CRITICAL",
                 category="Logging",
                 description="Hiç Log Message bulunamadı",
@@ -284,131 +500,68 @@ class UiPathXAMLAnalyzer:
                           "- Her döngü iterasyonu\n"
                           "- Hata durumları\n"
                           "- Önemli kararlar (If/Switch)"
-            ))
-        elif len(log_messages) < 3:
-            self.issues.append(Issue(
+            )
+        elif n_log_messages < 3:
+            self._emit(
                 severity="WARNING",
                 category="Logging",
-                description=f"Yetersiz logging: Sadece {len(log_messages)} log mesajı",
+                description=f"Yetersiz logging: Sadece {n_log_messages} log mesajı",
                 location="Tüm workflow",
                 suggestion="Daha fazla log mesajı ekleyin. Debug ve production monitoring için gerekli."
-            ))
+            )
 
     def check_file_paths(self):
         """Dosya yollarını kontrol et"""
         # Excel dosya yolları
-        excel_paths = []
-        for elem in self.root.iter():
-            if "WorkbookPath" in elem.attrib:
-                path = elem.get("WorkbookPath")
-                if re.search(r"[a-zA-Z]:\\", path) or path.startswith("\\\\"):
-                    self.issues.append(Issue(
-                        severity="WARNING",
-                        category="File Paths",
-                        description=f"Hardcoded dosya yolu kullanılıyor: {path}",
-                        location="WorkbookPath",
-                        suggestion="Path.Combine ile mutlak yol oluşturun veya Config dosyası kullanın. "
-                                  "Örnek: Path.Combine(Environment.CurrentDirectory, 'Data', 'file.xlsx')"
-                    ))
-                if "Auxilliary" in path:
-                    self.issues.append(Issue(
-                        severity="INFO",
-                        category="File Paths",
-                        description=f"Yazım hatası: 'Auxilliary' -> 'Auxiliary'",
-                        location=f"Path: {path}",
-                        suggestion="Klasör ismini düzeltin"
-                    ))
+        for path in self._workbook_paths:
+            if _DRIVE_PATH_RE.search(path) or path.startswith("\\\\"):
+                self._emit(
+                    severity="WARNING",
+                    category="File Paths",
+                    description=f"Hardcoded dosya yolu kullanılıyor: {path}",
+                    location="WorkbookPath",
+                    suggestion="Path.Combine ile mutlak yol oluşturun veya Config dosyası kullanın. "
+                              "Örnek: Path.Combine(Environment.CurrentDirectory, 'Data', 'file.xlsx')"
+                )
+            if "Auxilliary" in path:
+                self._emit(
+                    severity="INFO",
+                    category="File Paths",
+                    description=f"Yazım hatası: 'Auxilliary' -> 'Auxiliary'",
+                    location=f"Path: {path}",
+                    suggestion="Klasör ismini düzeltin"
+                )
 
     def check_variables(self):
         """Değişken kullanımını kontrol et"""
-        variables = self.find_all_elements("Variable")
-        var_names = [(var.get("Name"), var.get(f"{{{self.namespaces['x']}}}TypeArguments")) for var in variables]
+        variables = self._attrs.get("Variable", [])
+        var_names = [(var.get("Name"), var.get(_X_TYPE_ARGUMENTS)) for var in variables]
 
         for name, var_type in var_names:
-            if name and not re.match(r"^[a-z]+([A-Z][a-z0-9]+)*$|^[A-Z][a-z0-9]+([A-Z][a-z0-9]+)*$", name):
+            if name and not _NAME_CONV_RE.match(name):
                 if len(name) > 3 : # Kısa değişken adlarını (örn: i, j, dt) yoksay
-                    self.issues.append(Issue(
+                    self._emit(
                         severity="INFO",
                         category="Naming Convention",
                         description=f"Değişken ismi convention'a uymuyor: {name}",
                         location="Variable tanımı",
                         suggestion="camelCase (örn: 'kullaniciAdi') veya PascalCase (örn: 'KullaniciAdi') kullanın."
-                    ))
+                    )
 
     def check_performance(self):
         """Performans sorunlarını tespit et"""
         # Çok derin nested yapılar
-        max_depth = self._calculate_max_depth()
+        # Derinlik yükleme geçişinde çerçeve yığınından hesaplandı
+        max_depth = self._max_depth
         if max_depth > 7: # Genellikle 5-7 arası makul, 7'den sonrası karmaşıklaşır
-            self.issues.append(Issue(
+            self._emit(
                 severity="WARNING",
                 category="Performance",
                 description=f"Çok derin iç içe yapı: {max_depth} seviye",
                 location="Workflow yapısı",
                 suggestion="İç içe geçmiş yapıları yeniden düzenleyin. "
                           "Invoke Workflow kullanarak modüler hale getirin."
-            ))
-
-    def extract_urls(self):
-        """URL'leri dosyadan çıkar."""
-        url_pattern = re.compile(r'https?://[^\s"\'\]]+')
-        for elem in self.root.iter():
-            for key, value in elem.attrib.items():
-                if "Url" in key or "Uri" in key:
-                    if value and isinstance(value, str):
-                        self.urls.add(value.strip())
-                # Bazen URL'ler genel stringlerde olabilir
-                if isinstance(value, str):
-                    found = url_pattern.findall(value)
-                    for url in found:
-                        self.urls.add(url)
-
-    def extract_database_connections(self):
-        """Veritabanı bağlantılarını dosyadan çıkar."""
-        db_connect_activities = self.find_all_elements("DatabaseConnect")
-        for activity in db_connect_activities:
-            conn_string = activity.get("ConnectionString")
-            if conn_string:
-                self.db_connections.add(conn_string)
-
-    def extract_activities(self):
-        """Kullanılan tüm aktiviteleri listele."""
-        for elem in self.root.iter():
-            # Namespace'i kaldırıp sadece aktivite adını al
-            tag = elem.tag
-            if '}' in tag:
-                self.used_activities.add(tag.split('}', 1)[1])
-
-
-    def _find_nested_elements(self, parent: ET.Element, tag_names: List[str]) -> List[ET.Element]:
-        """Parent element içindeki belirli tag'leri bul"""
-        results = []
-        for tag_name in tag_names:
-            for ns_uri in self.namespaces.values():
-                results.extend(parent.findall(f".//{{{ns_uri}}}{tag_name}"))
-        return results
-
-    def _find_parent(self, root: ET.Element, child: ET.Element) -> ET.Element:
-        """Bir elementin parent'ını bul"""
-        for parent in root.iter():
-            if child in list(parent):
-                return parent
-        return None
-
-    def _calculate_max_depth(self, element: ET.Element = None, current_depth: int = 0) -> int:
-        """Maksimum nested depth'i hesapla"""
-        if element is None:
-            element = self.root
-
-        if len(element) == 0:
-            return current_depth
-
-        max_child_depth = current_depth
-        for child in element:
-            child_depth = self._calculate_max_depth(child, current_depth + 1)
-            max_child_depth = max(max_child_depth, child_depth)
-
-        return max_child_depth
+            )
 
     def print_report(self):
         """Analiz raporunu yazdır"""
@@ -417,10 +570,10 @@ class UiPathXAMLAnalyzer:
         print("=" * 80)
         print(f"📁 Dosya: {self.xaml_path.name}\n")
 
-        # Severity bazında grupla
-        critical = [i for i in self.issues if i.severity == "CRITICAL"]
-        warnings = [i for i in self.issues if i.severity == "WARNING"]
-        info = [i for i in self.issues if i.severity == "INFO"]
+        # Severity grupları analyze() içinde hazırlandı
+        critical = self._by_sev["CRITICAL"]
+        warnings = self._by_sev["WARNING"]
+        info = self._by_sev["INFO"]
 
         print(f"🔴 Kritik Sorunlar: {len(critical)}")
         print(f"⚠️  Uyarılar: {len(warnings)}")
@@ -495,110 +648,75 @@ class UiPathXAMLAnalyzer:
 
     def export_to_html(self, output_path: str = "analysis_report.html"):
         """Raporu HTML formatında dışa aktar"""
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>UiPath XAML Analiz Raporu</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
-                .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-                h1 {{ color: #333; border-bottom: 3px solid #007acc; padding-bottom: 10px; }}
-                h2 {{ color: #333; border-bottom: 2px solid #ccc; padding-bottom: 5px; margin-top: 40px;}}
-                .summary {{ display: flex; gap: 20px; margin: 20px 0; }}
-                .summary-box {{ flex: 1; padding: 20px; border-radius: 8px; text-align: center; color: white;}}
-                .critical {{ background: #d9534f; }}
-                .warning {{ background: #f0ad4e; }}
-                .info {{ background: #5bc0de; }}
-                .issue {{ margin: 20px 0; padding: 20px; border-left: 4px solid; border-radius: 5px; background: #f9f9f9;}}
-                .issue.critical-border {{ border-left-color: #d9534f; }}
-                .issue.warning-border {{ border-left-color: #f0ad4e; }}
-                .issue.info-border {{ border-left-color: #5bc0de; }}
-                .issue h3 {{ margin-top: 0; }}
-                .issue-category {{ display: inline-block; padding: 5px 10px; color: white; border-radius: 3px; font-size: 12px; }}
-                .category-critical {{ background: #d9534f; }}
-                .category-warning {{ background: #f0ad4e; }}
-                .category-info {{ background: #5bc0de; }}
-                .issue-location {{ color: #666; font-style: italic; }}
-                .suggestion {{ background: #e8f4f8; padding: 15px; border-radius: 5px; margin-top: 10px; }}
-                .resource-list {{ list-style-type: none; padding-left: 0; }}
-                .resource-list li {{ background: #eee; padding: 8px 12px; margin-bottom: 5px; border-radius: 3px; font-family: monospace; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>📊 UiPath XAML Analiz Raporu</h1>
-                <p><strong>Dosya:</strong> {self.xaml_path.name}</p>
-
-                <div class="summary">
-                    <div class="summary-box critical">
-                        <h2>{len([i for i in self.issues if i.severity == "CRITICAL"])}</h2>
-                        <p>Kritik Sorun</p>
-                    </div>
-                    <div class="summary-box warning">
-                        <h2>{len([i for i in self.issues if i.severity == "WARNING"])}</h2>
-                        <p>Uyarı</p>
-                    </div>
-                    <div class="summary-box info">
-                        <h2>{len([i for i in self.issues if i.severity == "INFO"])}</h2>
-                        <p>Bilgilendirme</p>
-                    </div>
-                </div>
-        """
+        # Parçalar üretildikçe tamponlu dosyaya yazılır; rapor bellekte birleştirilmez
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(self._render_html())
+
+        print(f"\n✅ HTML raporu oluşturuldu: {output_path}")
+
+    def _render_html(self):
+        """HTML raporunu parça parça üret"""
+        yield _HTML_HEADER.substitute(
+            file_name=escape(self.xaml_path.name),
+            n_critical=len(self._by_sev["CRITICAL"]),
+            n_warning=len(self._by_sev["WARNING"]),
+            n_info=len(self._by_sev["INFO"]),
+        )
 
         # Sorunlar
-        sections = {{"CRITICAL": "🔴 Kritik Sorunlar", "WARNING": "⚠️ Uyarılar", "INFO": "ℹ️ Bilgilendirmeler"}}
-        for severity, title in sections.items():
-            issues = [i for i in self.issues if i.severity == severity]
+        for severity, title in _HTML_SECTIONS:
+            issues = self._by_sev[severity]
             if issues:
-                html_content += f"<h2>{{title}}</h2>"
+                yield f"<h2>{title}</h2>"
+                css_class = severity.lower()
                 for issue in issues:
-                    html_content += f"""
-                        <div class="issue {{severity.lower()}}-border">
-                            <span class="issue-category category-{{severity.lower()}}">{{issue.category}}</span>
-                            <h3>{{issue.description}}</h3>
-                            <p class="issue-location">📍 {{issue.location}}</p>
-                            <div class="suggestion">
-                                <strong>💡 Öneri:</strong> {{issue.suggestion}}
-                            </div>
-                        </div>
-                    """
+                    yield _HTML_ISSUE.substitute(
+                        severity=css_class,
+                        category=escape(issue.category),
+                        description=escape(issue.description),
+                        location=escape(issue.location),
+                        suggestion=escape(issue.suggestion),
+                    )
 
         # Kaynaklar
-        html_content += "<h2>🛠️ Kullanılan Teknolojiler ve Servisler</h2>"
-        html_content += f"<h3>🔗 Bulunan URL'ler ({len(self.urls)})</h3>"
+        yield "<h2>🛠️ Kullanılan Teknolojiler ve Servisler</h2>"
+        yield f"<h3>🔗 Bulunan URL'ler ({len(self.urls)})</h3>"
         if self.urls:
-            html_content += "<ul class='resource-list'>"
+            yield "<ul class='resource-list'>"
             for url in self.urls:
-                html_content += f"<li>{{url}}</li>"
-            html_content += "</ul>"
+                yield f"<li>{escape(url)}</li>"
+            yield "</ul>"
 
-        html_content += f"<h3>🗄️ Bulunan Veritabanı Bağlantıları ({len(self.db_connections)})</h3>"
+        yield f"<h3>🗄️ Bulunan Veritabanı Bağlantıları ({len(self.db_connections)})</h3>"
         if self.db_connections:
-            html_content += "<ul class='resource-list'>"
+            yield "<ul class='resource-list'>"
             for db in self.db_connections:
-                html_content += f"<li>{{db}}</li>"
-            html_content += "</ul>"
+                yield f"<li>{escape(db)}</li>"
+            yield "</ul>"
 
-        html_content += f"<h3>🧩 Kullanılan Aktiviteler ({len(self.used_activities)})</h3>"
+        yield f"<h3>🧩 Kullanılan Aktiviteler ({len(self.used_activities)})</h3>"
         if self.used_activities:
-            html_content += "<ul class='resource-list'>"
+            yield "<ul class='resource-list'>"
             for activity in sorted(self.used_activities):
-                html_content += f"<li>{{activity}}</li>"
-            html_content += "</ul>"
+                yield f"<li>{escape(activity)}</li>"
+            yield "</ul>"
 
+        yield _HTML_FOOTER
 
-        html_content += """
-            </div>
-        </body>
-        </html>
-        """
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+def _analyze_one(xaml_file: Path) -> str:
+    """Tek bir XAML dosyasını analiz et, HTML raporunu yaz ve konsol çıktısını döndür"""
+    output = StringIO()
+    with redirect_stdout(output):
+        print(f"--- Analiz ediliyor: {xaml_file.name} ---")
+        # Analiz et
+        analyzer = UiPathXAMLAnalyzer(xaml_file)
+        analyzer.analyze()
 
-        print(f"\n✅ HTML raporu oluşturuldu: {output_path}")
+        # Her dosya için ayrı bir HTML raporu oluştur (opsiyonel)
+        report_filename = f"report_{xaml_file.stem}.html"
+        analyzer.export_to_html(report_filename)
+    return output.getvalue()
 
 
 # KULLANIM
@@ -612,12 +730,8 @@ if __name__ == "__main__":
     if not xaml_files:
         print(f"'{xaml_folder}' klasöründe .xaml dosyası bulunamadı.")
     else:
-        for xaml_file in xaml_files:
-            print(f"--- Analiz ediliyor: {xaml_file.name} ---")
-            # Analiz et
-            analyzer = UiPathXAMLAnalyzer(xaml_file)
-            analyzer.analyze()
-
-            # Her dosya için ayrı bir HTML raporu oluştur (opsiyonel)
-            report_filename = f"report_{{xaml_file.stem}}.html"
-            analyzer.export_to_html(report_filename)
+        # Dosyalar birbirinden bağımsız olduğu için ayrı süreçlerde analiz edilir;
+        # çıktılar karışmasın diye dosya sırasıyla yazdırılır
+        with ProcessPoolExecutor() as executor:
+            for output in executor.map(_analyze_one, xaml_files):
+                print(output, end="")
@@ -4,17 +4,98 @@ UiPath Workflow Analyzer Module
 UiPath .xaml ve .json dosyalarını analiz eden kütüphane
 """
 
-import xml.etree.ElementTree as ET
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
-from collections import defaultdict
+from typing import Dict, List, Tuple, Any, IO, Optional, Union
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from io import BytesIO
 import re
 
-
-@dataclass
+# libxml2 tabanlı lxml varsa onu kullan, yoksa standart ElementTree'ye dön
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+
+# XAML kaynağı: dosya yolu veya binary dosya nesnesi (örn. BytesIO)
+XAMLSource = Union[str, Path, IO[bytes]]
+
+# Sık kullanılan, namespace'i açılmış XAML tag/nitelik adları
+_XAML_NS = 'http://schemas.microsoft.com/winfx/2006/xaml'
+_X_STRING = f'{{{_XAML_NS}}}String'
+_X_TYPE_ARGUMENTS = f'{{{_XAML_NS}}}TypeArguments'
+
+# lxml yorum/PI düğümlerini ağaçta tutar; ElementTree ile aynı ağacı üretmek için atla.
+# Yüklenen XAML güvenilmez girdidir: harici entity'ler çözülmez, ağ erişimi
+# kapalıdır ve libxml2'nin boyut/derinlik sınırları (huge_tree) korunur.
+_ITERPARSE_OPTIONS = dict(
+    remove_blank_text=True, remove_comments=True, remove_pis=True,
+    collect_ids=False, resolve_entities=False, no_network=True
+) if HAS_LXML else {}
+
+# Aktivite olarak raporlanan tag localname'leri
+_ACTIVITY_TAGS = frozenset({
+    'Sequence', 'Flowchart', 'ForEachRow', 'If', 'While',
+    'NClick', 'NTypeInto', 'NGetText', 'ReadRange', 'WriteCell',
+    'ExcelApplicationCard', 'ExcelProcessScope', 'SaveExcelFile',
+    'TryCatch', 'LogMessage', 'OpenBrowser', 'AttachBrowser',
+})
+
+# Amaç tespiti ve düz metin özet için aktivite türü grupları
+_WEB_TYPES = frozenset({'NClick', 'NTypeInto', 'NGetText'})
+_EXCEL_TYPES = frozenset({'ReadRange', 'WriteCell'})
+_UI_AUTOMATION_TYPES = frozenset({
+    'OpenBrowser', 'NClick', 'NTypeInto', 'NGetText',
+    'Click', 'TypeInto', 'GetText', 'UseApplicationBrowser',
+})
+_EXCEL_AUTOMATION_TYPES = frozenset({
+    'ReadRange', 'WriteCell', 'ExcelApplicationCard', 'ExcelProcessScope', 'UseExcelFile',
+})
+_BROWSER_START_TYPES = frozenset({'OpenBrowser', 'UseApplicationBrowser'})
+_EXCEL_START_TYPES = frozenset({'ExcelApplicationCard', 'ExcelProcessScope', 'UseExcelFile'})
+_CLICK_TYPES = frozenset({'NClick', 'Click'})
+_TYPE_INTO_TYPES = frozenset({'NTypeInto', 'TypeInto'})
+_GET_TEXT_TYPES = frozenset({'NGetText', 'GetText'})
+
+# Aktivite türüne göre açıklanan amaç
+_PURPOSES = {
+    'Sequence': 'Adımları sırasıyla çalıştırır',
+    'ForEachRow': 'Veri tablosunun her satırında döngü yapar',
+    'NClick': 'UI elementine tıklar',
+    'NTypeInto': 'UI elementine metin yazı',
+    'NGetText': 'UI elementinden metin okur',
+    'ReadRange': 'Excel alanını okur',
+}
+_DEFAULT_PURPOSE = 'Bilinmeyen aktivite'
+
+# Timeout önerisi için kontrol edilen UI etkileşim aktiviteleri
+_UI_TIMEOUT_TYPES = frozenset({
+    'Click', 'TypeInto', 'NClick', 'NTypeInto', 'NGetText',
+    'OpenBrowser', 'AttachBrowser', 'UseApplicationBrowser',
+})
+
+# URL olarak kabul edilen değer önekleri (str.startswith için tuple)
+_URL_SCHEMES = ('http://', 'https://')
+
+# Alt ağaçtaki LogMessage elementleri: lxml'de C seviyesinde tag filtreli iter(),
+# ElementTree'de (iter() '{*}' joker karakterini desteklemez) iterfind
+if HAS_LXML:
+    def _iter_log_messages(elem):
+        return elem.iter('{*}LogMessage')
+else:
+    def _iter_log_messages(elem):
+        return elem.iterfind('.//{*}LogMessage')
+
+# Ciddiyet seviyesine göre sağlık skorundan düşülen puanlar
+_SEVERITY_PENALTIES = {'High': 15, 'Medium': 10}
+
+
+@dataclass(slots=True, frozen=True)
 class Issue:
     """Tespit edilen sorun"""
     severity: str  # "Critical", "High", "Medium", "Low"
@@ -25,7 +106,7 @@ class Issue:
     solution: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Activity:
     """Workflow aktivitesi"""
     name: str
@@ -36,7 +117,14 @@ class Activity:
     is_error_handled: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
+class IssueIndex:
+    """Ciddiyet seviyesine göre gruplanmış sorunlar"""
+    by_severity: Dict[str, List[Issue]] = field(default_factory=dict)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
 class WorkflowAnalysis:
     """Workflow analiz sonuçları"""
     workflow_name: str
@@ -50,88 +138,118 @@ class WorkflowAnalysis:
     urls: List[str] = field(default_factory=list)
     components: List[str] = field(default_factory=list)
     prose_summary: str = ""
+    issue_index: IssueIndex = field(default_factory=IssueIndex)
 
 
 class XAMLParser:
     """XAML dosyasını parse eden sınıf"""
     
-    def __init__(self, xaml_path: str):
+    def __init__(self, xaml_path: XAMLSource):
         self.xaml_path = xaml_path
         self.tree = None
         self.root = None
         self.raw_content = ""
+        self._activities: List[Dict[str, Any]] = []
+        self._variables: List[Tuple[str, str]] = []
+        self._urls: List[str] = []
+        self._by_type: Dict[str, List[ET.Element]] = defaultdict(list)
     
     def parse(self) -> bool:
-        """XAML dosyasını parse et"""
+        """XAML dosyasını (yol veya dosya nesnesi) parse et"""
         try:
-            with open(self.xaml_path, 'r', encoding='utf-8') as f:
-                self.raw_content = f.read()
-            self.root = ET.fromstring(self.raw_content)
+            if hasattr(self.xaml_path, 'read'):
+                data = self.xaml_path.read()
+            else:
+                with open(self.xaml_path, 'rb') as f:
+                    data = f.read()
+            self.raw_content = data.decode('utf-8')
+            self._scan(BytesIO(data))
             self.tree = ET.ElementTree(self.root)
             return True
         except Exception as e:
             print(f"❌ XAML parse hatası: {e}")
             return False
     
-    def get_activities(self) -> List[Dict[str, Any]]:
-        """Tüm aktiviteleri çıkar"""
+    def _scan(self, source: IO[bytes]) -> None:
+        """Aktiviteleri, değişkenleri ve URL'leri tek bir iterparse geçişinde topla"""
         activities = []
+        variables = []
+        urls = set()
+        strings = []
+        by_type = defaultdict(list)
         
-        if not self.root:
-            return activities
-        
-        for elem in self.root.iter():
-            tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
+        # Yalnızca 'start' olayları: nitelikler hazırdır ve belge sırası korunur
+        for _, elem in ET.iterparse(source, events=('start',), **_ITERPARSE_OPTIONS):
+            if self.root is None:
+                self.root = elem
             
-            if tag in ['Sequence', 'Flowchart', 'ForEachRow', 'If', 'While', 
-                      'NClick', 'NTypeInto', 'NGetText', 'ReadRange', 'WriteCell',
-                      'ExcelApplicationCard', 'ExcelProcessScope', 'SaveExcelFile',
-                      'TryCatch', 'LogMessage', 'OpenBrowser', 'AttachBrowser']:
+            # x:String metni 'start' anında henüz okunmamıştır; geçiş sonunda bakılır
+            if elem.tag == _X_STRING:
+                strings.append(elem)
+            
+            full_tag = elem.tag
+            tag = full_tag[full_tag.rfind('}') + 1:]
+            
+            if tag in _ACTIVITY_TAGS:
+                # Aktivite türü -> elementler dizini; varlık/adet sorguları ve
+                # TryCatch/If mantık kontrolleri (tam alt ağaçlarıyla) bunu kullanır
+                by_type[tag].append(elem)
                 activities.append({
                     'type': tag,
                     'name': elem.get('DisplayName', 'Unknown'),
-                    'attributes': dict(elem.attrib)
+                    'attributes': elem.attrib
                 })
+            
+            if 'Variable' in full_tag:
+                name = elem.get('Name', 'Unknown')
+                var_type = elem.get(_X_TYPE_ARGUMENTS, 'Unknown')
+                variables.append((name, var_type))
+            
+            # Url/Uri/Endpoint adlı nitelikler de aynı önek kontrolüne tabiydi;
+            # bu yüzden tek kontrol her iki durumu da kapsar
+            for attr_value in elem.attrib.values():
+                if attr_value.startswith(_URL_SCHEMES):
+                    urls.add(attr_value)
         
-        return activities
+        urls.update(elem.text for elem in strings
+                    if elem.text and elem.text.startswith(_URL_SCHEMES))
+        
+        self._by_type = by_type
+        self._activities = activities
+        self._variables = variables
+        self._urls = sorted(urls)
+    
+    def get_activities(self) -> List[Dict[str, Any]]:
+        """Tüm aktiviteleri çıkar"""
+        return self._activities
     
     def get_variables(self) -> List[Tuple[str, str]]:
         """Tüm değişkenleri çıkar"""
-        variables = []
-        
-        if not self.root:
-            return variables
-        
-        for elem in self.root.iter():
-            if 'Variable' in elem.tag:
-                name = elem.get('Name', 'Unknown')
-                var_type = elem.get('{http://schemas.microsoft.com/winfx/2006/xaml}TypeArguments', 'Unknown')
-                variables.append((name, var_type))
-        
-        return variables
+        return self._variables
 
     def get_urls(self) -> List[str]:
         """Aktivite niteliklerinden tüm URL'leri çıkar."""
-        urls = set()
-        if not self.root:
-            return []
-        
-        url_attributes = ['Url', 'Uri', 'Endpoint']
+        return self._urls
 
-        for elem in self.root.iter():
-            for attr_name, attr_value in elem.attrib.items():
-                if any(url_attr in attr_name for url_attr in url_attributes):
-                    if attr_value.startswith('http://') or attr_value.startswith('https://'):
-                        urls.add(attr_value)
-                
-                if isinstance(attr_value, str) and (attr_value.startswith('http://') or attr_value.startswith('https://')):
-                    urls.add(attr_value)
+    def get_activity_types(self):
+        """İş akışında bulunan aktivite türlerini döndür (küme benzeri görünüm)"""
+        return self._by_type.keys()
+
+    def has(self, activity_type: str) -> bool:
+        """Verilen türde en az bir aktivite var mı"""
+        return activity_type in self._by_type
 
-        for elem in self.root.iter('{http://schemas.microsoft.com/winfx/2006/xaml}String'):
-             if elem.text and (elem.text.startswith('http://') or elem.text.startswith('https://')):
-                urls.add(elem.text)
+    def count(self, activity_type: str) -> int:
+        """Verilen türdeki aktivite sayısı"""
+        return len(self._by_type.get(activity_type, ()))
 
-        return sorted(list(urls))
+    def get_try_catches(self) -> List[ET.Element]:
+        """Tüm TryCatch elementlerini belge sırasıyla döndür"""
+        return self._by_type.get('TryCatch', [])
+
+    def get_ifs(self) -> List[ET.Element]:
+        """Tüm If elementlerini belge sırasıyla döndür"""
+        return self._by_type.get('If', [])
 
 
 class JSONConfigParser:
@@ -189,7 +307,7 @@ class WorkflowAnalyzer:
         """Detaylı analiz yap"""
         project_info = self.json_parser.get_project_info()
         activities = self._extract_activities()
-        components = sorted(list(set(act.type for act in activities)))
+        components = sorted(self.xaml_parser.get_activity_types())
         
         self.analysis = WorkflowAnalysis(
             workflow_name=project_info.get('name', 'Unknown'),
@@ -203,6 +321,7 @@ class WorkflowAnalyzer:
         
         self.analysis.prose_summary = self._generate_prose_summary()
         self.analysis.issues = self._detect_issues()
+        self.analysis.issue_index = _build_issue_index(self.analysis.issues)
         self.analysis.recommendations = self._generate_recommendations()
         self.analysis.overall_health_score = self._calculate_health_score()
         
@@ -213,13 +332,13 @@ class WorkflowAnalyzer:
         if not self.analysis or not self.analysis.activities:
             return "İş akışı hakkında bir özet oluşturmak için yeterli aktivite bulunamadı."
 
-        activity_types = set(act.type for act in self.analysis.activities)
+        activity_types = self.xaml_parser.get_activity_types()
         
         summary_parts = []
         
         # Identify the main category of the workflow
-        is_web_automation = any(t in activity_types for t in ['OpenBrowser', 'NClick', 'NTypeInto', 'NGetText', 'Click', 'TypeInto', 'GetText', 'UseApplicationBrowser'])
-        is_excel_automation = any(t in activity_types for t in ['ReadRange', 'WriteCell', 'ExcelApplicationCard', 'ExcelProcessScope', 'UseExcelFile'])
+        is_web_automation = bool(activity_types & _UI_AUTOMATION_TYPES)
+        is_excel_automation = bool(activity_types & _EXCEL_AUTOMATION_TYPES)
         is_data_processing = 'ForEachRow' in activity_types
         
         # Start the summary
@@ -233,9 +352,9 @@ class WorkflowAnalyzer:
             summary_parts.append("Bu, tanımlanmış adımları belirli bir sırada yürüten genel bir iş akışıdır.")
 
         # Describe the process flow
-        if 'OpenBrowser' in activity_types or 'UseApplicationBrowser' in activity_types:
+        if activity_types & _BROWSER_START_TYPES:
             summary_parts.append("Süreç, bir web tarayıcısı açarak veya mevcut bir tarayıcıyı kullanarak başlar.")
-        elif 'ExcelApplicationCard' in activity_types or 'ExcelProcessScope' in activity_types or 'UseExcelFile' in activity_types:
+        elif activity_types & _EXCEL_START_TYPES:
             summary_parts.append("Süreç, bir Excel dosyasıyla çalışarak başlar.")
 
         if is_data_processing:
@@ -243,11 +362,11 @@ class WorkflowAnalyzer:
         
         # Mention specific common actions
         actions = set()
-        if any(t in activity_types for t in ['NClick', 'Click']):
+        if activity_types & _CLICK_TYPES:
             actions.add("butonlara tıklama")
-        if any(t in activity_types for t in ['NTypeInto', 'TypeInto']):
+        if activity_types & _TYPE_INTO_TYPES:
             actions.add("form alanlarına veri girme")
-        if any(t in activity_types for t in ['NGetText', 'GetText']):
+        if activity_types & _GET_TEXT_TYPES:
             actions.add("ekrandan metin okuma")
         if 'ReadRange' in activity_types:
             actions.add("Excel'den toplu veri okuma")
@@ -271,14 +390,13 @@ class WorkflowAnalyzer:
         project_info = self.json_parser.get_project_info()
         purpose = f"Proje: {project_info.get('name', 'Unknown')}\n"
         
-        activities = self.xaml_parser.get_activities()
-        activity_types = set(act['type'] for act in activities)
+        activity_types = self.xaml_parser.get_activity_types()
         
-        if any(x in str(activity_types) for x in ['NClick', 'NTypeInto', 'NGetText']):
+        if activity_types & _WEB_TYPES:
             purpose += "- Web Automation\n"
-        if any(x in str(activity_types) for x in ['ReadRange', 'WriteCell']):
+        if activity_types & _EXCEL_TYPES:
             purpose += "- Excel İşleme\n"
-        if 'ForEachRow' in str(activity_types):
+        if 'ForEachRow' in activity_types:
             purpose += "- Toplu İşleme\n"
         
         return purpose
@@ -287,29 +405,18 @@ class WorkflowAnalyzer:
         """Aktiviteleri çıkar"""
         activities = []
         xaml_activities = self.xaml_parser.get_activities()
+        get_purpose = _PURPOSES.get
         
         for act in xaml_activities:
             activity = Activity(
                 name=act['name'],
                 type=act['type'],
-                purpose=self._get_activity_purpose(act['type'])
+                purpose=get_purpose(act['type'], _DEFAULT_PURPOSE)
             )
             activities.append(activity)
         
         return activities
     
-    def _get_activity_purpose(self, activity_type: str) -> str:
-        """Aktivite türüne göre amacını açıkla"""
-        purposes = {
-            'Sequence': 'Adımları sırasıyla çalıştırır',
-            'ForEachRow': 'Veri tablosunun her satırında döngü yapar',
-            'NClick': 'UI elementine tıklar',
-            'NTypeInto': 'UI elementine metin yazı',
-            'NGetText': 'UI elementinden metin okur',
-            'ReadRange': 'Excel alanını okur',
-        }
-        return purposes.get(activity_type, 'Bilinmeyen aktivite')
-    
     def _extract_variables(self) -> List[str]:
         """Değişkenleri çıkar"""
         variables = self.xaml_parser.get_variables()
@@ -320,7 +427,7 @@ class WorkflowAnalyzer:
         issues = []
         activities = self.xaml_parser.get_activities()
         
-        if not any(act['type'] == 'TryCatch' for act in activities) and len(activities) > 5:
+        if not self.xaml_parser.has('TryCatch') and len(activities) > 5:
             issues.append(Issue(
                 severity='High',
                 category='Error Handling',
@@ -345,8 +452,8 @@ class WorkflowAnalyzer:
         if root is None:
             return issues
         
-        # Find all TryCatch activities using a namespace-agnostic search
-        for trycatch_element in root.findall('.//{*}TryCatch'):
+        # TryCatch activities were collected during the parse pass
+        for trycatch_element in self.xaml_parser.get_try_catches():
             # Find the Catches section
             catches_element = trycatch_element.find('{*}TryCatch.Catches')
             if catches_element is None:
@@ -358,7 +465,7 @@ class WorkflowAnalyzer:
                     continue
                 
                 # Find LogMessage activities within this Catch
-                for log_message_element in catch_element.iterfind('.//{*}LogMessage'):
+                for log_message_element in _iter_log_messages(catch_element):
                     log_level = log_message_element.get('Level')
                     
                     # Default level is Info if not specified.
@@ -393,7 +500,7 @@ class WorkflowAnalyzer:
         """Boş Try, Catch, If/Then/Else bloklarını bulur."""
         issues = []
         # Check for empty Try/Catch
-        for trycatch_element in root.findall('.//{*}TryCatch'):
+        for trycatch_element in self.xaml_parser.get_try_catches():
             tc_name = trycatch_element.get('DisplayName', 'Try Catch')
             
             try_element = trycatch_element.find('{*}TryCatch.Try')
@@ -418,7 +525,7 @@ class WorkflowAnalyzer:
                         ))
 
         # Check for empty If/Then/Else
-        for if_element in root.findall('.//{*}If'):
+        for if_element in self.xaml_parser.get_ifs():
             if_name = if_element.get('DisplayName', 'If')
             
             then_element = if_element.find('{*}If.Then')
@@ -448,13 +555,23 @@ class WorkflowAnalyzer:
 
         if not variables:
             return issues
+        
+        # A plain substring count is an upper bound on the word-bounded count,
+        # so names seen at most once are unused without running the regex.
+        names = sorted({name for name, _ in variables if name and xaml_content.count(name) > 1},
+                       key=len, reverse=True)
+        
+        # The remaining names are counted in a single scan with one alternation
+        # regex. Longer names are tried first so a name never shadows a longer one.
+        occurrences = Counter()
+        if names:
+            pattern = re.compile(r'\b(' + '|'.join(map(re.escape, names)) + r')\b')
+            occurrences.update(pattern.findall(xaml_content))
             
         for var_name, var_type in variables:
             # The variable must appear at least twice: 1 for declaration, 1+ for usage.
-            # We use regex with word boundaries (\b) to avoid matching substrings.
-            occurrences = re.findall(r'\b' + re.escape(var_name) + r'\b', xaml_content)
-            
-            if len(occurrences) <= 1:
+            # Word boundaries (\b) in the pattern avoid matching substrings.
+            if var_name and occurrences[var_name] <= 1:
                 issues.append(Issue(
                     severity='Low',
                     category='Code Smell',
@@ -472,32 +589,33 @@ class WorkflowAnalyzer:
         activities = self.xaml_parser.get_activities()
 
         # 1. Error Handling Recommendation
-        if not any(act['type'] == 'TryCatch' for act in activities) and len(activities) > 5:
+        if not self.xaml_parser.has('TryCatch') and len(activities) > 5:
             recommendations.append(
                 "Global Error Handling Ekleyin: Projenin ana adımlarını bir 'Try Catch' aktivitesi içine alarak beklenmedik hatalara karşı (örn: uygulama çökmeleri, selektör bulunamaması) projenizi daha dayanıklı hale getirin. 'Catch' bölümünde hatayı loglayıp, süreci kontrollü bir şekilde sonlandırabilir veya alternatif bir akış başlatabilirsiniz."
             )
 
         # 2. Logging Recommendation
-        if not any(act['type'] == 'LogMessage' for act in activities):
+        log_message_count = self.xaml_parser.count('LogMessage')
+        if not log_message_count:
             recommendations.append(
                 "Süreç Takibi için Loglama Yapın: İş akışının başlangıcına ve sonuna 'Log Message' (Level: Info) ekleyerek sürecin ne zaman başlayıp bittiğini ve ne kadar sürdüğünü takip edin. Ayrıca, önemli adımlardan (örn: bir dosyayı işledikten sonra, bir API çağrısından önce) sonra loglama yapmak, hata ayıklamayı büyük ölçüde kolaylaştırır."
             )
-        elif len([act for act in activities if act['type'] == 'LogMessage']) < 3:
+        elif log_message_count < 3:
              recommendations.append(
                 "Loglamayı Detaylandırın: Mevcut loglama yetersiz olabilir. 'Catch' blokları içinde hatanın detayını (Exception.Message, Exception.Source) 'Log Message' (Level: Error) ile logladığınızdan emin olun. Ayrıca, iş akışındaki kritik parametreleri ve karar noktalarını da loglayarak sürecin akışını daha şeffaf hale getirin."
             )
 
         # 3. Timeout Settings Recommendation
-        ui_activity_types = ['Click', 'TypeInto', 'NClick', 'NTypeInto', 'NGetText', 'OpenBrowser', 'AttachBrowser', 'UseApplicationBrowser']
-        activities_to_check = [act for act in activities if act['type'] in ui_activity_types]
-        
-        if activities_to_check:
-            acts_without_timeout = []
-            for act in activities_to_check:
+        has_ui_activities = False
+        acts_without_timeout = []
+        for act in activities:
+            if act['type'] in _UI_TIMEOUT_TYPES:
+                has_ui_activities = True
                 # Modern activities use TimeoutMS, classic may use Timeout.
                 if 'TimeoutMS' not in act['attributes'] and 'Timeout' not in act['attributes']:
                     acts_without_timeout.append(f"'{act['name']}'")
-            
+        
+        if has_ui_activities:
             if acts_without_timeout:
                 recommendations.append(
                     f"Zaman Aşımı (Timeout) Ayarlarını Belirtin: {', '.join(acts_without_timeout)} gibi UI etkileşim aktivitelerinde özel bir timeout değeri belirtilmemiş. Hedef uygulamanın yavaş yanıt vermesi durumunda robotun gereksiz yere uzun süre beklemesini veya erken hata vermesini önlemek için bu aktivitelere makul bir 'TimeoutMS' değeri (örn: 10000 for 10s) atayın."
@@ -516,32 +634,39 @@ class WorkflowAnalyzer:
     
     def _calculate_health_score(self) -> float:
         """Workflow sağlık skorunu hesapla"""
-        score = 100.0
-        for issue in self.analysis.issues:
-            if issue.severity == 'High':
-                score -= 15
-            elif issue.severity == 'Medium':
-                score -= 10
-        return max(0, score)
+        counts = self.analysis.issue_index.counts
+        penalty = sum(weight * counts.get(severity, 0) for severity, weight in _SEVERITY_PENALTIES.items())
+        return max(0.0, 100.0 - penalty)
+
 
+def _build_issue_index(issues: List[Issue]) -> IssueIndex:
+    """Sorunları tek geçişte ciddiyet seviyesine göre grupla"""
+    by_severity: Dict[str, List[Issue]] = {}
+    for issue in issues:
+        by_severity.setdefault(issue.severity, []).append(issue)
+    counts = {severity: len(items) for severity, items in by_severity.items()}
+    return IssueIndex(by_severity=by_severity, counts=counts)
 
-def analyze_workflow(xaml_path: str) -> WorkflowAnalysis:
+
+def analyze_workflow(xaml_source: XAMLSource, json_path: Optional[str] = None) -> WorkflowAnalysis:
     """
     Workflow'u analiz et ve sonuçları döndür
     
     Args:
-        xaml_path: XAML dosyasının yolu
+        xaml_source: XAML dosyasının yolu veya binary dosya nesnesi
+        json_path: (Opsiyonel) project.json dosyasının yolu
     
     Returns:
         WorkflowAnalysis: Analiz sonuçları
     """
-    xaml_parser = XAMLParser(xaml_path)
+    xaml_parser = XAMLParser(xaml_source)
     if not xaml_parser.parse():
-        raise ValueError(f"XAML dosyası parse edilemedi: {xaml_path}")
+        raise ValueError(f"XAML dosyası parse edilemedi: {getattr(xaml_source, 'name', xaml_source)}")
     
-    # JSON yapılandırması olmadan devam etmek için sahte bir JSON ayrıştırıcı oluştur
-    json_parser = JSONConfigParser()
+    # json_path verilmezse boş bir yapılandırma ile devam edilir
+    json_parser = JSONConfigParser(json_path)
     json_parser.parse()
     
     analyzer = WorkflowAnalyzer(xaml_parser, json_parser)
     return analyzer.analyze()
+